@@ -1,2 +1,2 @@
 
-from .classifier import KoppenClassification
+from .classifier import KoppenClassification, KoppenBatch, KOPPEN_CLASSES, UNKNOWN_CODE, classify_c, classify_grid, classify_grid_codes, classify_dataarray
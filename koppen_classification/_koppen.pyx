@@ -0,0 +1,136 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Compiled classifier backend, used by koppen_classification.classify_c when built.
+Mirrors the classifier of koppen_classification.classifier and returns the same integer codes.
+"""
+
+from libc.math cimport INFINITY, isfinite
+
+import numpy as np
+
+# First code of each group in KOPPEN_CLASSES
+cdef enum:
+    CODE_B = 0
+    CODE_A = 4
+    CODE_C = 7
+    CODE_D = 16
+    CODE_E = 28
+    # Stations with missing (non-finite) monthly values
+    CODE_UNKNOWN = 255
+
+
+cdef inline bint _is_summer(int m, bint south) noexcept nogil:
+    # Apr-Sept is summer in the northern hemisphere, Oct-March in the southern one
+    return (3 <= m <= 8) != south
+
+
+cdef int _classify(const double[::1] precip, const double[::1] temp, bint south) noexcept nogil:
+    cdef double prcp_sum = 0.0, temp_sum = 0.0, summer_sum = 0.0
+    cdef double prcp_min = precip[0], temp_min = temp[0], temp_max = temp[0]
+    cdef double temp_mean, winter_sum, wet_season_sum, prcp_threshold, p
+    cdef double summer_min, summer_max, winter_min, winter_max
+    cdef int m, nu_mon_gt10deg, dry, warm
+
+    # Statistics needed by every classification, in a single pass over the 12 months
+    for m in range(12):
+        p = precip[m]
+        prcp_sum += p
+        temp_sum += temp[m]
+        if p < prcp_min:
+            prcp_min = p
+        if temp[m] < temp_min:
+            temp_min = temp[m]
+        if temp[m] > temp_max:
+            temp_max = temp[m]
+        if _is_summer(m, south):
+            summer_sum += p
+    temp_mean = temp_sum / 12
+    winter_sum = prcp_sum - summer_sum
+
+    # Missing data: the annual sums are finite only if every monthly value is
+    if not (isfinite(prcp_sum) and isfinite(temp_mean)):
+        return CODE_UNKNOWN
+
+    # Precipitation threshold for the arid (B) group
+    wet_season_sum = 0.7 * prcp_sum
+    if winter_sum > wet_season_sum:
+        prcp_threshold = 20 * temp_mean
+    elif summer_sum > wet_season_sum:
+        prcp_threshold = 20 * temp_mean + 280
+    else:
+        prcp_threshold = 20 * temp_mean + 140
+
+    # Group B: Arid climates, desert (W) or steppe (S), hot (h) or cold (k)
+    if prcp_sum < prcp_threshold:
+        return CODE_B + 2 * (prcp_sum >= prcp_threshold / 2) + (temp_mean < 18)
+
+    # Group A: Tropical climates, rainforest (f), monsoon (m) or savanna (w)
+    if temp_min >= 18:
+        if prcp_min >= 60:
+            return CODE_A
+        return CODE_A + 1 if prcp_min >= 100 - prcp_sum / 25 else CODE_A + 2
+
+    # Group E: Polar climates, tundra (T) or ice cap (F)
+    if temp_max <= 10:
+        return CODE_E if temp_max > 0 else CODE_E + 1
+
+    # Groups C and D: statistics only needed here, then the dry season (s, w, f)
+    # and temperature (a, b, c, d) letters
+    nu_mon_gt10deg = 0
+    summer_min, summer_max = INFINITY, -INFINITY
+    winter_min, winter_max = INFINITY, -INFINITY
+    for m in range(12):
+        p = precip[m]
+        if temp[m] > 10:
+            nu_mon_gt10deg += 1
+        if _is_summer(m, south):
+            summer_min = min(summer_min, p)
+            summer_max = max(summer_max, p)
+        else:
+            winter_min = min(winter_min, p)
+            winter_max = max(winter_max, p)
+
+    if summer_min < 40 and summer_min < winter_max / 3:
+        dry = 0
+    elif winter_min < summer_max / 10:
+        dry = 1
+    else:
+        dry = 2
+    if temp_max >= 22:
+        warm = 0
+    elif nu_mon_gt10deg >= 4:
+        warm = 1
+    elif temp_min < -38:
+        warm = 3
+    else:
+        warm = 2
+    return CODE_C + 3 * dry + warm if temp_min > 0 else CODE_D + 4 * dry + warm
+
+
+def classify_c(const double[::1] precip, const double[::1] temp, bint south):
+    """
+    Classifies one station from contiguous float64 monthly arrays, returning its
+    integer code into KOPPEN_CLASSES (CODE_UNKNOWN for missing data).
+    """
+    if precip.shape[0] != 12 or temp.shape[0] != 12:
+        raise ValueError("Precipitation and temperature arrays must each contain 12 monthly values.")
+    cdef int code
+    with nogil:
+        code = _classify(precip, temp, south)
+    return code
+
+
+def classify_many_c(const double[:, ::1] precip, const double[:, ::1] temp, const unsigned char[::1] south):
+    """
+    Classifies stations stored row-wise in contiguous (N, 12) float64 arrays, with
+    south as an (N,) uint8 array, returning (N,) uint8 codes.
+    """
+    cdef Py_ssize_t i, n = precip.shape[0]
+    if precip.shape[1] != 12 or temp.shape[0] != n or temp.shape[1] != 12 or south.shape[0] != n:
+        raise ValueError("Precipitation and temperature arrays must both have shape (N, 12) and south shape (N,).")
+    codes = np.empty(n, dtype=np.uint8)
+    cdef unsigned char[::1] out = codes
+    with nogil:
+        for i in range(n):
+            out[i] = _classify(precip[i], temp[i], south[i])
+    return codes
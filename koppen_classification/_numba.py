@@ -0,0 +1,99 @@
+"""
+Numba kernels of the classifier. Importing this module imports numba, so the
+classifier only does so on first use, see classifier._numba_kernels.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+from . import classifier
+
+precip_threshold = njit(cache=True)(classifier._precip_threshold)
+group_code = njit(cache=True)(classifier._group_code)
+cd_code = njit(cache=True)(classifier._cd_code)
+
+
+@njit(cache=True)
+def stats(precip, temp, south):
+    """
+    Computes the climate statistics needed by every classification in a single pass over the 12 months.
+    Missing (NaN) values propagate into the statistics as they do with NumPy reductions.
+
+    Returns:
+    tuple: (prcp_sum, prcp_min, temp_mean, temp_min, temp_max, prcp_summer_sum, prcp_winter_sum)
+    """
+    prcp_sum, temp_sum = 0.0, 0.0
+    prcp_min, temp_min, temp_max = precip[0], temp[0], temp[0]
+    summer_sum = 0.0
+    for m in range(12):
+        p, t = precip[m], temp[m]
+        prcp_sum += p
+        temp_sum += t
+        # Once a minimum or maximum is NaN no comparison replaces it
+        if p < prcp_min or np.isnan(p):
+            prcp_min = p
+        if t < temp_min or np.isnan(t):
+            temp_min = t
+        if t > temp_max or np.isnan(t):
+            temp_max = t
+        # Apr-Sept is summer in the northern hemisphere, Oct-March in the southern one
+        if (3 <= m <= 8) != south:
+            summer_sum += p
+    # Winter is the rest of the year, as in the NumPy and Cython classifiers
+    return prcp_sum, prcp_min, temp_sum / 12, temp_min, temp_max, summer_sum, prcp_sum - summer_sum
+
+
+@njit(cache=True)
+def season_extremes(precip, temp, south):
+    """
+    Computes the statistics only needed by the C and D groups in a single pass over the 12 months.
+    Missing (NaN) values propagate into the statistics as they do with NumPy reductions.
+
+    Returns:
+    tuple: (nu_mon_gt10deg, prcp_summer_min, prcp_summer_max, prcp_winter_min, prcp_winter_max)
+    """
+    nu_mon_gt10deg = 0
+    summer_min, summer_max = np.inf, -np.inf
+    winter_min, winter_max = np.inf, -np.inf
+    for m in range(12):
+        p = precip[m]
+        if temp[m] > 10:
+            nu_mon_gt10deg += 1
+        if (3 <= m <= 8) != south:
+            if p < summer_min or np.isnan(p):
+                summer_min = p
+            if p > summer_max or np.isnan(p):
+                summer_max = p
+        else:
+            if p < winter_min or np.isnan(p):
+                winter_min = p
+            if p > winter_max or np.isnan(p):
+                winter_max = p
+    return nu_mon_gt10deg, summer_min, summer_max, winter_min, winter_max
+
+
+@njit(cache=True)
+def koppen(precip, temp, south):
+    """
+    Köppen classification of one station, see classifier.classify_c.
+    Returns its integer code into KOPPEN_CLASSES, or UNKNOWN_CODE if any monthly value is missing.
+    """
+    prcp_sum, prcp_min, temp_mean, temp_min, temp_max, summer_sum, winter_sum = stats(precip, temp, south)
+    prcp_threshold = precip_threshold(temp_mean, prcp_sum, summer_sum, winter_sum)
+    code = group_code(prcp_sum, prcp_min, temp_mean, temp_min, temp_max, prcp_threshold)
+    if code < 0:
+        nu_mon_gt10deg, summer_min, summer_max, winter_min, winter_max = season_extremes(precip, temp, south)
+        code = cd_code(temp_min, temp_max, nu_mon_gt10deg, summer_min, summer_max, winter_min, winter_max)
+    return np.uint8(code)
+
+
+@njit(cache=True, parallel=True)
+def koppen_many(precip, temp, south):
+    """
+    Classifies stations stored column-wise in (12, N) arrays in parallel, returning (N,) codes.
+    """
+    n = precip.shape[1]
+    codes = np.empty(n, dtype=np.uint8)
+    for i in prange(n):
+        codes[i] = koppen(precip[:, i], temp[:, i], south[i])
+    return codes
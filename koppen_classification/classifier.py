@@ -1,8 +1,174 @@
+import importlib.util
+import math
+from functools import cached_property
+
 import numpy as np
-import matplotlib.pyplot as plt
+
+# numba is optional; it is only imported, and its kernels compiled, on first use
+_HAS_NUMBA = importlib.util.find_spec("numba") is not None
+
+try:
+    from ._koppen import classify_c as _classify_c_ext, classify_many_c as _classify_many_c_ext
+except ImportError:  # compiled backend not built; classify with numba or NumPy
+    _classify_c_ext = _classify_many_c_ext = None
+
+# Köppen class labels indexed by the integer codes returned by classify_grid_codes.
+# Within the C and D groups the code is laid out as base + dry-season letter (s, w, f)
+# times the number of temperature letters (a, b, c[, d]) + temperature letter.
+KOPPEN_CLASSES = (
+    "BWh", "BWk", "BSh", "BSk",
+    "Af", "Am", "Aw",
+    "Csa", "Csb", "Csc", "Cwa", "Cwb", "Cwc", "Cfa", "Cfb", "Cfc",
+    "Dsa", "Dsb", "Dsc", "Dsd", "Dwa", "Dwb", "Dwc", "Dwd", "Dfa", "Dfb", "Dfc", "Dfd",
+    "ET", "EF",
+)
+
+# Code given to stations with missing (NaN) or otherwise non-finite monthly values,
+# as used for ocean and missing cells in gridded climate datasets
+UNKNOWN_CODE = 255
+
+# Labels for every uint8 code; codes outside KOPPEN_CLASSES decode as 'Unknown'
+_CLASS_LABELS = np.array(KOPPEN_CLASSES + ("Unknown",) * (256 - len(KOPPEN_CLASSES)))
+
+# First code of each group in KOPPEN_CLASSES
+_CODE_B, _CODE_A, _CODE_C, _CODE_D, _CODE_E = 0, 4, 7, 16, 28
+
+# Summer and winter month masks: Apr-Sept is summer in the northern hemisphere,
+# Oct-March in the southern one
+_SUMMER_MASK_N = np.array([False, False, False, True, True, True, True, True, True, False, False, False])
+_WINTER_MASK_N = ~_SUMMER_MASK_N
+_SUMMER_MASK_S, _WINTER_MASK_S = _WINTER_MASK_N, _SUMMER_MASK_N
+
+
+def _numba_kernels():
+    """
+    The numba kernels of the classifier, importing numba and the ._numba module on first use.
+    """
+    from . import _numba
+    return _numba
+
+
+def _precip_threshold(temp_mean, prcp_sum, prcp_summer_sum, prcp_winter_sum):
+    """
+    Precipitation threshold for the arid (B) group, see KoppenClassification.calculate_precip_threshold.
+    Shared by the Python classifier and the numba kernels.
+    """
+    wet_season_sum = 0.7 * prcp_sum
+    if prcp_winter_sum > wet_season_sum:
+        # Winter is wetter: basic threshold
+        return 20 * temp_mean
+    elif prcp_summer_sum > wet_season_sum:
+        # Summer is wetter: threshold includes an additional adjustment
+        return 20 * temp_mean + 280
+    else:
+        # Both seasons contribute rainfall: intermediate threshold adjustment
+        return 20 * temp_mean + 140
+
+
+def _group_code(prcp_sum, prcp_min, temp_mean, temp_min, temp_max, prcp_threshold):
+    """
+    First step of the Köppen classification of one station, shared by the Python
+    classifier and the numba kernels. Returns the integer code of B, A and E stations,
+    UNKNOWN_CODE if any monthly value is missing, and -1 for C and D stations, which
+    _cd_code classifies from the statistics only needed by those groups.
+    """
+    # Branch order: B takes precedence over the temperature groups, is the most
+    # frequent one over land and is a single comparison, so it is tested first.
+    # The remaining groups are told apart by temp_min >= 18 (A) and temp_max > 10
+    # (C/D, else E); testing C/D ahead of A would need a compound condition and
+    # cost more comparisons on average than it saves.
+
+    # Missing data: the annual sums are finite only if every monthly value is
+    if not (math.isfinite(prcp_sum) and math.isfinite(temp_mean)):
+        return UNKNOWN_CODE
+    # Group B: Arid climates - total precipitation is less than the threshold
+    # Desert (W) below half the threshold, else steppe (S); hot (h, mean temp >= 18°C) or cold (k)
+    if prcp_sum < prcp_threshold:
+        code = _CODE_B
+        if prcp_sum >= prcp_threshold / 2:
+            code += 2
+        if temp_mean < 18:
+            code += 1
+        return code
+    # Group A: Tropical climates - all months have a temperature >= 18°C
+    # Rainforest (f) if every month has >= 60 mm, else monsoon (m) or savanna (w)
+    # depending on the rainfall of the driest month
+    if temp_min >= 18:
+        if prcp_min >= 60:
+            return _CODE_A
+        elif prcp_min >= 100 - prcp_sum / 25:
+            return _CODE_A + 1
+        return _CODE_A + 2
+    # Groups C and D: warmest month > 10°C
+    if temp_max > 10:
+        return -1
+    # Group E: Polar climates - no month has a temperature > 10°C
+    # Tundra (T) if at least one month is above 0°C, else ice cap (F)
+    return _CODE_E if temp_max > 0 else _CODE_E + 1
+
+
+def _cd_code(temp_min, temp_max, nu_mon_gt10deg, prcp_summer_min, prcp_summer_max,
+             prcp_winter_min, prcp_winter_max):
+    """
+    Integer code of a C or D station, see _group_code.
+    """
+    # C (Temperate) if the coldest month is above 0°C, else D (Continental), followed by
+    # the dry season letter: 's' dry summer, 'w' dry winter, 'f' no dry season, and the
+    # temperature letter: 'a' hot summer (max temp >= 22°C), 'b' warm summer, 'c' cool
+    # summer, 'd' extremely cold winters (min temp < -38°C, which can only occur in D)
+    if prcp_summer_min < 40 and prcp_summer_min < prcp_winter_max / 3:
+        dry = 0
+    elif prcp_winter_min < prcp_summer_max / 10:
+        dry = 1
+    else:
+        dry = 2
+    if temp_max >= 22:
+        warm = 0
+    elif nu_mon_gt10deg >= 4:
+        warm = 1
+    elif temp_min < -38:
+        warm = 3
+    else:
+        warm = 2
+    return _CODE_C + 3 * dry + warm if temp_min > 0 else _CODE_D + 4 * dry + warm
+
+
+def classify_c(precip, temp, south):
+    """
+    Classifies one station with the compiled classifier, returning its integer code into
+    KOPPEN_CLASSES, or UNKNOWN_CODE if any monthly value is missing.
+    Uses the Cython extension when it is built, which needs no JIT warm-up, else the
+    numba kernels, and KoppenClassification without either. Inputs are upcast to float64.
+
+    Parameters:
+    precip (array-like): 12 monthly precipitation values.
+    temp (array-like): 12 monthly temperature values.
+    south (bool): True if southern hemisphere.
+
+    Returns:
+    int: The Köppen class code.
+    """
+    precip = np.ascontiguousarray(precip, dtype=np.float64)
+    temp = np.ascontiguousarray(temp, dtype=np.float64)
+    if precip.shape != (12,) or temp.shape != (12,):
+        raise ValueError("Precipitation and temperature arrays must each contain 12 monthly values.")
+    if _classify_c_ext is not None or _HAS_NUMBA:
+        return _compiled_code(precip, temp, bool(south))
+    return KoppenClassification(precip, temp, south)._classify_code()
+
+
+def _compiled_code(precip, temp, south):
+    # Integer code of one validated station from the Cython extension, else from numba
+    if _classify_c_ext is not None:
+        return _classify_c_ext(np.ascontiguousarray(precip, dtype=np.float64),
+                               np.ascontiguousarray(temp, dtype=np.float64), south)
+    return int(_numba_kernels().koppen(precip, temp, south))
+
 
 class KoppenClassification:
     def __init__(self, precip, temp, south):
+        precip = np.asarray(precip)
+        temp = np.asarray(temp)
         # Check if precip and temp arrays have 12 monthly values
         if len(precip) != 12 or len(temp) != 12:
             raise ValueError("Precipitation and temperature arrays must each contain 12 monthly values.")
@@ -12,34 +178,105 @@ class KoppenClassification:
         self.temp = temp               # Monthly temperature values
         self.south = bool(south)       # Boolean for hemisphere; True if southern hemisphere
         
-        # Calculate basic climate statistics
-        self.temp_mean = temp.mean()   # Mean annual temperature
-        self.prcp_sum = precip.sum()   # Total annual precipitation
-        self.prcp_min = precip.min()   # Minimum monthly precipitation
-        self.temp_min = temp.min()     # Minimum monthly temperature
-        self.temp_max = temp.max()     # Maximum monthly temperature
-        self.nu_mon_gt10deg = (temp > 10).astype(int).sum()  # Number of months with temperature > 10°C
-        
-        # Define summer and winter months based on hemisphere
-        # If in southern hemisphere, summer is from Oct-March; else Apr-Sept
-        self.mon_sw = [[3, 4, 5, 6, 7, 8], [0, 1, 2, 9, 10, 11]]
-        self.mon_ind = {'summer': self.mon_sw[1], 'winter': self.mon_sw[0]} if self.south else {'summer': self.mon_sw[0], 'winter': self.mon_sw[1]}
-        
-        # Separate seasonal precipitation data
-        self.prcp_summer = precip[self.mon_ind['summer']]  # Precipitation in summer months
-        self.prcp_winter = precip[self.mon_ind['winter']]  # Precipitation in winter months
-        
-        # Calculate precipitation threshold for climate classification
-        self.prcp_threshold = self.calculate_precip_threshold()
-        
-        # Seasonal precipitation statistics
-        self.prcp_summer_min = self.prcp_summer.min()  # Minimum summer precipitation
-        self.prcp_summer_max = self.prcp_summer.max()  # Maximum summer precipitation
-        self.prcp_winter_min = self.prcp_winter.min()  # Minimum winter precipitation
-        self.prcp_winter_max = self.prcp_winter.max()  # Maximum winter precipitation
-        
-        # Perform classification
-        self.koppen_class = self.classify()
+        # Climate statistics are computed lazily on first access: classification with
+        # a compiled backend does not need them, and the ones only used by the C and D
+        # groups are only computed for stations in those groups
+
+    @cached_property
+    def _stats(self):
+        # Statistics needed by every classification. They are NumPy reductions on every
+        # backend, so summary() gives the same values and types whether or not numba is
+        # installed; the compiled classifiers compute their own in one pass
+        precip, temp = self.precip, self.temp
+        prcp_sum = precip.sum()
+        prcp_summer_sum = precip[_SUMMER_MASK_S if self.south else _SUMMER_MASK_N].sum()
+        # Winter is the rest of the year; missing stations are classified from the
+        # annual sums alone, so inf - inf is harmless here
+        with np.errstate(invalid='ignore'):
+            prcp_winter_sum = prcp_sum - prcp_summer_sum
+        return (prcp_sum, precip.min(), temp.sum() / 12, temp.min(), temp.max(),
+                prcp_summer_sum, prcp_winter_sum)
+
+    @cached_property
+    def prcp_sum(self):
+        """Total annual precipitation"""
+        return self._stats[0]
+
+    @cached_property
+    def prcp_min(self):
+        """Minimum monthly precipitation"""
+        return self._stats[1]
+
+    @cached_property
+    def temp_mean(self):
+        """Mean annual temperature"""
+        return self._stats[2]
+
+    @cached_property
+    def temp_min(self):
+        """Minimum monthly temperature"""
+        return self._stats[3]
+
+    @cached_property
+    def temp_max(self):
+        """Maximum monthly temperature"""
+        return self._stats[4]
+
+    @cached_property
+    def prcp_summer_sum(self):
+        """Total summer precipitation"""
+        return self._stats[5]
+
+    @cached_property
+    def prcp_winter_sum(self):
+        """Total winter precipitation"""
+        return self._stats[6]
+
+    @cached_property
+    def prcp_threshold(self):
+        """Precipitation threshold for climate classification"""
+        return self.calculate_precip_threshold()
+
+    @cached_property
+    def prcp_summer(self):
+        """Precipitation in summer months"""
+        return self.precip[_SUMMER_MASK_S if self.south else _SUMMER_MASK_N]
+
+    @cached_property
+    def prcp_winter(self):
+        """Precipitation in winter months"""
+        return self.precip[_WINTER_MASK_S if self.south else _WINTER_MASK_N]
+
+    @cached_property
+    def _cd_stats(self):
+        summer = self.precip[_SUMMER_MASK_S if self.south else _SUMMER_MASK_N]
+        winter = self.precip[_WINTER_MASK_S if self.south else _WINTER_MASK_N]
+        return ((self.temp > 10).sum(), summer.min(), summer.max(), winter.min(), winter.max())
+
+    @cached_property
+    def nu_mon_gt10deg(self):
+        """Number of months with temperature > 10°C"""
+        return self._cd_stats[0]
+
+    @cached_property
+    def prcp_summer_min(self):
+        """Minimum summer precipitation"""
+        return self._cd_stats[1]
+
+    @cached_property
+    def prcp_summer_max(self):
+        """Maximum summer precipitation"""
+        return self._cd_stats[2]
+
+    @cached_property
+    def prcp_winter_min(self):
+        """Minimum winter precipitation"""
+        return self._cd_stats[3]
+
+    @cached_property
+    def prcp_winter_max(self):
+        """Maximum winter precipitation"""
+        return self._cd_stats[4]
 
     def calculate_precip_threshold(self):
         """
@@ -47,15 +284,14 @@ class KoppenClassification:
         This threshold determines aridity for climate classification:
         - Adjusted by annual temperature and distribution of rainfall.
         """
-        if self.prcp_winter.sum() > 0.7 * self.prcp_sum:
-            # Winter is wetter: basic threshold
-            return 20 * self.temp_mean
-        elif self.prcp_summer.sum() > 0.7 * self.prcp_sum:
-            # Summer is wetter: threshold includes an additional adjustment
-            return 20 * self.temp_mean + 280
-        else:
-            # Both seasons contribute rainfall: intermediate threshold adjustment
-            return 20 * self.temp_mean + 140
+        return _precip_threshold(self.temp_mean, self.prcp_sum, self.prcp_summer_sum, self.prcp_winter_sum)
+
+    @cached_property
+    def koppen_class(self):
+        """
+        The Köppen climate classification code, computed on first access.
+        """
+        return self.classify()
 
     def classify(self):
         """
@@ -66,94 +302,30 @@ class KoppenClassification:
         - Seasonal distribution of precipitation (summer vs. winter)
         - Temperature characteristics (mean, max, and min monthly temperatures)
 
+        The rules themselves are shared with the compiled backends, see classify_c.
+
         Returns:
-            koppen_class (str): A Köppen climate classification code based on temperature and precipitation criteria.
+            koppen_class (str): A Köppen climate classification code based on temperature and precipitation criteria,
+            or 'Unknown' if any monthly value is missing.
         """
-        
-        # Group B: Arid climates - total precipitation is less than the threshold
-        if self.prcp_sum < self.prcp_threshold:
-            koppen_class = "B"  # Base classification for Arid climates
-            
-            # Determine specific arid subclass: Desert (BW) or Steppe (BS)
-            koppen_class += "W" if self.prcp_sum < self.prcp_threshold / 2 else "S"
-            
-            # Temperature indicator for arid climates:
-            # 'h' for hot, low-latitude (mean temp >= 18°C)
-            # 'k' for cold, mid-latitude (mean temp < 18°C)
-            koppen_class += "h" if self.temp_mean >= 18 else "k"
-        
-        # Group A: Tropical climates - all months have a temperature >= 18°C
-        elif self.temp_min >= 18:
-            koppen_class = "A"  # Base classification for Tropical climates
-            
-            # Further classification of Tropical climates based on monthly rainfall:
-            if self.prcp_min >= 60:
-                koppen_class += "f"  # Rainforest: all months have significant rainfall
-            else:
-                # Monsoon (Am) or Savanna (Aw) subtypes based on rainfall in the driest month
-                koppen_class += "m" if self.prcp_min >= 100 - self.prcp_sum / 25 else "w"
-        
-        # Group C: Temperate climates - warmest month > 10°C and coldest month between 0°C and 18°C
-        elif self.temp_max > 10 and 0 < self.temp_min < 18:
-            koppen_class = "C"  # Base classification for Temperate climates
-            
-            # Determine dry season:
-            # 's' for dry summer, 'w' for dry winter, 'f' for no distinct dry season
-            if self.prcp_summer_min < 40 and self.prcp_summer_min < self.prcp_winter_max / 3:
-                koppen_class += "s"  # Dry summer
-            elif self.prcp_winter_min < self.prcp_summer_max / 10:
-                koppen_class += "w"  # Dry winter
-            else:
-                koppen_class += "f"  # No dry season
-            
-            # Further classify based on summer temperatures:
-            # 'a' for hot summer (max temp >= 22°C), 'b' for warm summer, 'c' for cool summer
-            if self.temp_max >= 22:
-                koppen_class += "a"
-            elif self.nu_mon_gt10deg >= 4:
-                koppen_class += "b"
-            else:
-                koppen_class += "c"
-        
-        # Group D: Continental climates - warmest month > 10°C and coldest month <= 0°C
-        elif self.temp_max > 10 and self.temp_min <= 0:
-            koppen_class = "D"  # Base classification for Continental climates
-            
-            # Determine dry season:
-            # 's' for dry summer, 'w' for dry winter, 'f' for no distinct dry season
-            if self.prcp_summer_min < 40 and self.prcp_summer_min < self.prcp_winter_max / 3:
-                koppen_class += "s"  # Dry summer
-            elif self.prcp_winter_min < self.prcp_summer_max / 10:
-                koppen_class += "w"  # Dry winter
-            else:
-                koppen_class += "f"  # No dry season
-            
-            # Further classify based on temperature:
-            # 'a' for hot summer (max temp >= 22°C), 'b' for warm summer, 'c' for cool summer,
-            # 'd' for extremely cold winters (min temp < -38°C)
-            if self.temp_max >= 22:
-                koppen_class += "a"
-            elif self.nu_mon_gt10deg >= 4:
-                koppen_class += "b"
-            elif self.temp_min < -38:
-                koppen_class += "d"
-            else:
-                koppen_class += "c"
-        
-        # Group E: Polar climates - no month has a temperature > 10°C
-        elif self.temp_max <= 10:
-            koppen_class = "E"  # Base classification for Polar climates
-            
-            # Further subclassification:
-            # 'T' for Tundra (temp > 0°C in at least one month)
-            # 'F' for Ice Cap (no month above 0°C)
-            koppen_class += "T" if self.temp_max > 0 else "F"
-        
-        # If none of the criteria match, classification is unknown
-        else:
-            koppen_class = 'Unknown'
-        
-        return koppen_class
+        return str(_CLASS_LABELS[self._code])
+
+    @cached_property
+    def _code(self):
+        # Integer code into KOPPEN_CLASSES: with a compiled backend in one call on the
+        # monthly values, else from the statistics of this instance
+        if _classify_c_ext is not None or _HAS_NUMBA:
+            return _compiled_code(self.precip, self.temp, self.south)
+        return self._classify_code()
+
+    def _classify_code(self):
+        # The C/D statistics are only computed for stations in those groups
+        prcp_sum, prcp_min, temp_mean, temp_min, temp_max, summer_sum, winter_sum = self._stats
+        code = _group_code(prcp_sum, prcp_min, temp_mean, temp_min, temp_max,
+                           _precip_threshold(temp_mean, prcp_sum, summer_sum, winter_sum))
+        if code < 0:
+            code = _cd_code(temp_min, temp_max, *self._cd_stats)
+        return code
 
     def summary(self):
         """
@@ -194,6 +366,8 @@ class KoppenClassification:
         Returns:
         matplotlib.figure.Figure: A figure object representing the plot.
         """
+        import matplotlib.pyplot as plt
+
         months = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
         lab1, lab3 = 'Temperature (°C)', 'Precipitation (mm)'
         xlab, ylab1, ylab2 = 'Month', 'Temperature (°C)', 'Precipitation (mm)'
@@ -219,3 +393,264 @@ class KoppenClassification:
         fig.legend(loc='lower left', fontsize=9, ncols=2, bbox_to_anchor=(0.2, -0.05))
 
         return fig
+
+
+def _grid_stats(precip, temp, south):
+    """
+    NumPy counterpart of the numba stats and season_extremes kernels for month-first arrays,
+    reducing over axis 0.
+    Every cell needs its own reductions anyway, so all statistics are computed at once and
+    returned in the order of stats followed by season_extremes.
+    """
+    # Basic climate statistics, reduced over the month axis
+    temp_mean = temp.mean(axis=0)
+    prcp_sum = precip.sum(axis=0)
+    prcp_min = precip.min(axis=0)
+    temp_min = temp.min(axis=0)
+    temp_max = temp.max(axis=0)
+    nu_mon_gt10deg = (temp > 10).sum(axis=0, dtype=np.int8)
+
+    # Apr-Sept is summer in the northern hemisphere and winter in the southern one
+    # Seasonal stats are taken by masking in place and reducing over all 12 months,
+    # which avoids gathering the months across the grid
+    amjjas_mask = _SUMMER_MASK_N.reshape((12,) + (1,) * (precip.ndim - 1))
+    ondjfm_mask = ~amjjas_mask
+    amjjas_sum = np.where(amjjas_mask, precip, 0).sum(axis=0)
+    # Missing cells are classified from the annual sums alone, so inf - inf is harmless here
+    with np.errstate(invalid='ignore'):
+        ondjfm_sum = prcp_sum - amjjas_sum
+    # Masked-out months are filled with values no month can beat, in the dtype of
+    # precip so that integer inputs keep integer extremes as in KoppenClassification
+    if np.issubdtype(precip.dtype, np.integer):
+        fill_min, fill_max = np.iinfo(precip.dtype).max, np.iinfo(precip.dtype).min
+    else:
+        fill_min, fill_max = np.inf, -np.inf
+    amjjas_min = np.where(amjjas_mask, precip, fill_min).min(axis=0)
+    ondjfm_min = np.where(ondjfm_mask, precip, fill_min).min(axis=0)
+    amjjas_max = np.where(amjjas_mask, precip, fill_max).max(axis=0)
+    ondjfm_max = np.where(ondjfm_mask, precip, fill_max).max(axis=0)
+
+    prcp_summer_sum = np.where(south, ondjfm_sum, amjjas_sum)
+    prcp_winter_sum = np.where(south, amjjas_sum, ondjfm_sum)
+    prcp_summer_min = np.where(south, ondjfm_min, amjjas_min)
+    prcp_summer_max = np.where(south, ondjfm_max, amjjas_max)
+    prcp_winter_min = np.where(south, amjjas_min, ondjfm_min)
+    prcp_winter_max = np.where(south, amjjas_max, ondjfm_max)
+    return (prcp_sum, prcp_min, temp_mean, temp_min, temp_max, prcp_summer_sum, prcp_winter_sum,
+            nu_mon_gt10deg, prcp_summer_min, prcp_summer_max, prcp_winter_min, prcp_winter_max)
+
+
+def _grid_precip_threshold(temp_mean, prcp_sum, prcp_summer_sum, prcp_winter_sum):
+    """
+    NumPy counterpart of _precip_threshold.
+    """
+    wet_season_sum = 0.7 * prcp_sum
+    return np.select(
+        [prcp_winter_sum > wet_season_sum, prcp_summer_sum > wet_season_sum],
+        [20 * temp_mean, 20 * temp_mean + 280],
+        default=20 * temp_mean + 140,
+    )
+
+
+def _grid_codes(prcp_sum, prcp_min, temp_mean, temp_min, temp_max, nu_mon_gt10deg,
+                prcp_summer_min, prcp_summer_max, prcp_winter_min, prcp_winter_max, prcp_threshold):
+    """
+    Integer Köppen codes from arrays of climate statistics, see classify_grid_codes.
+    """
+    # Subclass codes for every cell; only the ones of the matching group are kept
+    code_b = _CODE_B + 2 * (prcp_sum >= prcp_threshold / 2) + (temp_mean < 18)
+    code_a = _CODE_A + np.where(prcp_min >= 60, 0, np.where(prcp_min >= 100 - prcp_sum / 25, 1, 2))
+    dry = np.where((prcp_summer_min < 40) & (prcp_summer_min < prcp_winter_max / 3), 0,
+                   np.where(prcp_winter_min < prcp_summer_max / 10, 1, 2))
+    # 'd' (-38°C winters) can only occur in the D group since C requires temp_min > 0
+    warm = np.where(temp_max >= 22, 0, np.where(nu_mon_gt10deg >= 4, 1, np.where(temp_min < -38, 3, 2)))
+    code_c = _CODE_C + 3 * dry + warm
+    code_d = _CODE_D + 4 * dry + warm
+    code_e = _CODE_E + (temp_max <= 0)
+
+    # Group conditions in the same order as _group_code; np.select
+    # picks the first one that holds, and anything left over is polar (E).
+    # Cells with missing data come first: the annual sums are finite only if every
+    # monthly value is.
+    missing = ~(np.isfinite(prcp_sum) & np.isfinite(temp_mean))
+    codes = np.select(
+        [missing, prcp_sum < prcp_threshold, temp_min >= 18, (temp_max > 10) & (temp_min > 0), temp_max > 10],
+        [UNKNOWN_CODE, code_b, code_a, code_c, code_d],
+        default=code_e,
+    )
+    return codes.astype(np.uint8)
+
+
+def classify_grid_codes(precip, temp, south):
+    """
+    Classifies a grid of monthly climatologies, returning integer Köppen codes.
+    The numba and NumPy classifiers use inputs in their own dtype, so float32 is preferred
+    for large grids as it halves the memory traffic of the monthly reductions. The Cython
+    extension, used when it is built and numba is not installed, upcasts to float64.
+
+    Parameters:
+    precip (array-like): Monthly precipitation with shape (12, ...), e.g. (12, H, W).
+    temp (array-like): Monthly temperature with the same shape as precip.
+    south (bool or array-like): True for southern hemisphere cells; scalar or shape (H, W).
+
+    Returns:
+    numpy.ndarray: uint8 codes with shape (...), indexing into KOPPEN_CLASSES, or
+    UNKNOWN_CODE for cells with missing (non-finite) monthly values.
+    """
+    precip = np.asarray(precip)
+    temp = np.asarray(temp)
+    if precip.shape[0] != 12 or temp.shape[0] != 12:
+        raise ValueError("Precipitation and temperature arrays must each contain 12 monthly values along the first axis.")
+    south = np.asarray(south, dtype=bool)
+
+    if _HAS_NUMBA or _classify_many_c_ext is not None:
+        # Flatten the grid to (12, N) stations and run a compiled classifier: numba in
+        # parallel, else the Cython extension on contiguous float64 (N, 12) rows
+        shape = np.broadcast_shapes(precip.shape[1:], temp.shape[1:], south.shape)
+        precip = np.broadcast_to(precip, (12,) + shape).reshape(12, -1)
+        temp = np.broadcast_to(temp, (12,) + shape).reshape(12, -1)
+        south = np.broadcast_to(south, shape).reshape(-1)
+        if _HAS_NUMBA:
+            return _numba_kernels().koppen_many(precip, temp, south).reshape(shape)
+        return _classify_many_c_ext(np.ascontiguousarray(precip.T, dtype=np.float64),
+                                    np.ascontiguousarray(temp.T, dtype=np.float64),
+                                    np.ascontiguousarray(south, dtype=np.uint8)).reshape(shape)
+
+    return _classify_grid_codes_numpy(precip, temp, south)
+
+
+def _classify_grid_codes_numpy(precip, temp, south):
+    # Vectorized NumPy classifier, used by classify_grid_codes without a compiled backend
+    (prcp_sum, prcp_min, temp_mean, temp_min, temp_max, summer_sum, winter_sum,
+     nu_mon_gt10deg, summer_min, summer_max, winter_min, winter_max) = _grid_stats(precip, temp, south)
+    prcp_threshold = _grid_precip_threshold(temp_mean, prcp_sum, summer_sum, winter_sum)
+    return _grid_codes(prcp_sum, prcp_min, temp_mean, temp_min, temp_max, nu_mon_gt10deg,
+                       summer_min, summer_max, winter_min, winter_max, prcp_threshold)
+
+
+def classify_grid(precip, temp, south):
+    """
+    Classifies a grid of monthly climatologies according to the Köppen classification system.
+    A single station (arrays of shape (12,)) is the degenerate case and yields a 0-d array.
+    See classify_grid_codes for the preferred input dtype.
+
+    Parameters:
+    precip (array-like): Monthly precipitation with shape (12, ...), e.g. (12, H, W).
+    temp (array-like): Monthly temperature with the same shape as precip.
+    south (bool or array-like): True for southern hemisphere cells; scalar or shape (H, W).
+
+    Returns:
+    numpy.ndarray: Köppen class labels with shape (...), 'Unknown' for cells with missing data.
+    """
+    return _CLASS_LABELS[classify_grid_codes(precip, temp, south)]
+
+
+class KoppenBatch:
+    """
+    Köppen classification of many stations at once.
+
+    Counterpart of KoppenClassification for (N, 12) arrays holding one station per row:
+    every statistic is computed with a single vectorized reduction over all stations
+    and stored as an (N,) array.
+    """
+
+    def __init__(self, precip, temp, south):
+        precip = np.asarray(precip)
+        temp = np.asarray(temp)
+        # Check if precip and temp arrays have 12 monthly values per station
+        if precip.ndim != 2 or precip.shape[1] != 12 or temp.shape != precip.shape:
+            raise ValueError("Precipitation and temperature arrays must both have shape (N, 12).")
+        
+        # Initialize input variables
+        self.precip = precip           # Monthly precipitation values, one station per row
+        self.temp = temp               # Monthly temperature values, one station per row
+        self.south = np.broadcast_to(np.asarray(south, dtype=bool), precip.shape[:1])  # True if southern hemisphere
+        
+        # Calculate climate statistics for all stations, reducing over the month axis
+        (self.prcp_sum, self.prcp_min, self.temp_mean, self.temp_min, self.temp_max,
+         self.prcp_summer_sum, self.prcp_winter_sum, self.nu_mon_gt10deg,
+         self.prcp_summer_min, self.prcp_summer_max, self.prcp_winter_min, self.prcp_winter_max,
+         ) = _grid_stats(precip.T, temp.T, self.south)
+        
+        # Calculate precipitation threshold for climate classification
+        self.prcp_threshold = _grid_precip_threshold(self.temp_mean, self.prcp_sum,
+                                                     self.prcp_summer_sum, self.prcp_winter_sum)
+        
+        # Perform classification into integer codes indexing KOPPEN_CLASSES (UNKNOWN_CODE for missing data)
+        self.koppen_code = _grid_codes(self.prcp_sum, self.prcp_min, self.temp_mean, self.temp_min,
+                                       self.temp_max, self.nu_mon_gt10deg,
+                                       self.prcp_summer_min, self.prcp_summer_max,
+                                       self.prcp_winter_min, self.prcp_winter_max, self.prcp_threshold)
+
+    @cached_property
+    def koppen_class(self):
+        """
+        The Köppen climate classification codes of all stations, computed on first access.
+        """
+        return _CLASS_LABELS[self.koppen_code]
+
+    def summary(self):
+        """
+        Returns a summary dictionary containing climate statistics, one array entry per station.
+        """
+        return {
+            'mean temperature': self.temp_mean,
+            'max temperature': self.temp_max,
+            'min temperature': self.temp_min,
+            'num of months hotter than 10 deg': self.nu_mon_gt10deg,
+            'precip threshold': self.prcp_threshold,
+            'minimum summer precip': self.prcp_summer_min,
+            'maximum summer precip': self.prcp_summer_max,
+            'minimum winter rain': self.prcp_winter_min,
+            'maximum winter rain': self.prcp_winter_max,
+            'annual accum rain': self.prcp_sum,
+            'minimum monthly rain': self.prcp_min
+        }
+
+    def get_classification(self, writeout=False):
+        """
+        Returns the climate classification codes, with an optional summary of statistics.
+        :param writeout: If True, returns classifications and climate summary dictionary
+        """
+        if writeout:
+            return self.koppen_class, self.summary()
+        else:
+            return self.koppen_class
+
+
+def _classify_grid_codes_last(precip, temp, south):
+    # xarray.apply_ufunc moves the core (month) dimension to the last axis
+    return classify_grid_codes(np.moveaxis(precip, -1, 0), np.moveaxis(temp, -1, 0), south)
+
+
+def classify_dataarray(precip, temp, south, month_dim='month'):
+    """
+    Classifies xarray DataArrays of monthly climatologies, returning integer Köppen codes.
+    Dask-backed inputs are classified lazily chunk by chunk; the month dimension must be
+    a single chunk, else a ValueError is raised. As for classify_grid_codes, float32 inputs are preferred.
+
+    Parameters:
+    precip (xarray.DataArray): Monthly precipitation with a 12-long month dimension.
+    temp (xarray.DataArray): Monthly temperature with the same month dimension.
+    south (xarray.DataArray or bool): True for southern hemisphere cells.
+    month_dim (str): Name of the month dimension.
+
+    Returns:
+    xarray.DataArray: uint8 codes indexing into KOPPEN_CLASSES (UNKNOWN_CODE for missing data),
+    without the month dimension.
+    """
+    import xarray as xr
+
+    # Every cell needs its 12 months at once, so dask chunks must not split them
+    for array in (precip, temp):
+        if len(array.chunksizes.get(month_dim, ())) > 1:
+            raise ValueError(f"The {month_dim!r} dimension must be a single chunk; "
+                             f"rechunk with .chunk({{{month_dim!r}: -1}}).")
+
+    return xr.apply_ufunc(
+        _classify_grid_codes_last, precip, temp, south,
+        input_core_dims=[[month_dim], [month_dim], []],
+        output_core_dims=[[]],
+        dask='parallelized',
+        output_dtypes=[np.uint8],
+    )
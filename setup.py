@@ -1,16 +1,32 @@
 
-from setuptools import setup, find_packages
+from setuptools import setup, find_packages, Extension
+
+# The compiled classifier backend is optional; without Cython, or if the extension
+# fails to build (e.g. no C compiler), the package falls back to numba / NumPy
+try:
+    from Cython.Build import cythonize
+    ext_modules = cythonize(
+        [Extension("koppen_classification._koppen", ["koppen_classification/_koppen.pyx"])],
+        language_level=3,
+    )
+    # cythonize does not carry optional over from the Extension it is given
+    for ext in ext_modules:
+        ext.optional = True
+except ImportError:
+    ext_modules = []
 
 setup(
     name="KoppenClimate",
     version="0.1",
     description="Koppen Climate Classification Tool",
     packages=find_packages(),
+    ext_modules=ext_modules,
     install_requires=["numpy", "matplotlib"],
+    extras_require={"numba": ["numba"], "xarray": ["xarray", "dask"]},
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
     ],
-    python_requires=">=3.6",
+    python_requires=">=3.8",
 )
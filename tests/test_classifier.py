@@ -1,6 +1,15 @@
 
 import numpy as np
-from koppen_classification import KoppenClassification
+import matplotlib.pyplot as plt
+from koppen_classification import (KoppenClassification, KoppenBatch, KOPPEN_CLASSES, UNKNOWN_CODE, classify_c,
+                                   classify_grid, classify_grid_codes)
+from koppen_classification import classifier, classify_dataarray
+
+try:
+    import xarray as xr
+    import dask
+except ImportError:  # the xarray checks below need the optional xarray and dask dependencies
+    xr = None
 
 precip = np.array([30, 40, 20, 60, 80, 100, 150, 140, 90, 70, 50, 40])
 temp = np.array([10, 12, 15, 18, 20, 25, 30, 28, 22, 15, 12, 8])
@@ -11,5 +20,88 @@ print("Classification:", koppen.get_classification(writeout=True))
 koppen_south = KoppenClassification(precip, temp, south=True)
 print("Classification (Southern Hemisphere):", koppen_south.get_classification(writeout=True))
 
+# Statistics keep the input dtype on every backend: integer inputs give integer extremes
+assert all(isinstance(koppen.summary()[key], np.integer)
+           for key in ('minimum summer precip', 'maximum winter rain', 'minimum monthly rain'))
+
+# Classify both stations at once as a (12, 1, 2) grid
+grid = classify_grid(np.stack([precip, precip], axis=-1)[:, None, :],
+                     np.stack([temp, temp], axis=-1)[:, None, :],
+                     south=np.array([[False, True]]))
+print("Grid classification:", grid)
+assert grid[0, 0] == koppen.get_classification()
+assert grid[0, 1] == koppen_south.get_classification()
+
+# float32 grids give the same classes, and the NumPy classifier reduces them without upcasting
+precip32, temp32 = precip.astype(np.float32), temp.astype(np.float32)
+grid32 = classify_grid(precip32, temp32, south=False)
+assert grid32 == koppen.get_classification()
+stats32 = classifier._grid_stats(precip32, temp32, False)
+prcp_sum32, temp_mean32, summer_sum32, winter_sum32 = stats32[0], stats32[2], stats32[5], stats32[6]
+assert all(stat.dtype == np.float32 for stat in stats32[:7] + stats32[8:])
+assert classifier._grid_precip_threshold(temp_mean32, prcp_sum32, summer_sum32, winter_sum32).dtype == np.float32
+
+# Classify both stations at once as an (N, 12) batch
+batch = KoppenBatch(np.stack([precip, precip]), np.stack([temp, temp]), south=[False, True])
+print("Batch classification:", batch.get_classification(writeout=True))
+assert list(batch.get_classification()) == [koppen.get_classification(), koppen_south.get_classification()]
+assert all(isinstance(batch.summary()[key][0], np.integer)
+           for key in ('minimum summer precip', 'maximum winter rain', 'minimum monthly rain'))
+
+# Compiled backend (or its numba / NumPy fallback) returns integer codes
+code = classify_c(precip.astype(np.float64), temp.astype(np.float64), False)
+assert KOPPEN_CLASSES[code] == koppen.get_classification()
+
+# Stations with a missing monthly value are 'Unknown' on every entry point
+precip_nan = precip.astype(np.float64)
+precip_nan[6] = np.nan
+assert KoppenClassification(precip_nan, temp, south=False).get_classification() == 'Unknown'
+batch_nan = KoppenBatch(np.stack([precip_nan, precip]), np.stack([temp, temp]), south=False)
+assert list(batch_nan.get_classification()) == ['Unknown', koppen.get_classification()]
+assert classify_grid(precip_nan, temp, south=False) == 'Unknown'
+assert classify_c(precip_nan, temp, False) == UNKNOWN_CODE
+
+# xarray inputs give the same codes, eagerly and lazily with dask; the month
+# dimension must not be split over several chunks
+if xr is not None:
+    precip_da = xr.DataArray(np.stack([precip, precip]), dims=('station', 'month'))
+    temp_da = xr.DataArray(np.stack([temp, temp]), dims=('station', 'month'))
+    south_da = xr.DataArray([False, True], dims='station')
+    codes_da = classify_dataarray(precip_da, temp_da, south_da)
+    assert codes_da.dims == ('station',) and codes_da.dtype == np.uint8
+    assert [KOPPEN_CLASSES[c] for c in codes_da.values] == [koppen.get_classification(), koppen_south.get_classification()]
+    lazy_da = classify_dataarray(precip_da.chunk({'station': 1}), temp_da.chunk({'station': 1}),
+                                 south_da.chunk({'station': 1}))
+    assert lazy_da.chunks is not None
+    assert (lazy_da.compute() == codes_da).all()
+    try:
+        classify_dataarray(precip_da.chunk({'month': 6}), temp_da, south_da)
+    except ValueError as error:
+        assert "'month' dimension must be a single chunk" in str(error)
+    else:
+        raise AssertionError("classify_dataarray accepted a month dimension split over several chunks")
+
+# Every backend gives the same codes on random climates, some with missing months:
+# the NumPy grid classifier, the KoppenClassification statistics, and the numba
+# kernels and Cython extension when they are available
+rng = np.random.default_rng(0)
+n = 2000
+precips = rng.gamma(1.0, 60, (n, 12)) * rng.uniform(0, 3, (n, 1))
+temps = (rng.uniform(-50, 35, (n, 1)) + rng.uniform(0, 25, (n, 1))
+         * np.sin(np.linspace(0, 2 * np.pi, 12, endpoint=False) + rng.uniform(0, 2 * np.pi, (n, 1))))
+souths = rng.random(n) < 0.5
+precips[::100, 5] = np.nan
+temps[50::100, 0] = np.nan
+codes = classifier._classify_grid_codes_numpy(precips.T, temps.T, souths)
+assert (codes == UNKNOWN_CODE).sum() == 40
+assert len(np.unique(codes)) >= 25
+assert list(codes) == [KoppenClassification(p, t, s)._classify_code() for p, t, s in zip(precips, temps, souths)]
+assert (classify_grid_codes(precips.T, temps.T, souths) == codes).all()
+assert [classify_c(p, t, s) for p, t, s in zip(precips, temps, souths)] == list(codes)
+if classifier._HAS_NUMBA:
+    assert (classifier._numba_kernels().koppen_many(precips.T, temps.T, souths) == codes).all()
+if classifier._classify_many_c_ext is not None:
+    assert (classifier._classify_many_c_ext(precips, temps, souths.astype(np.uint8)) == codes).all()
+
 koppen.plot_hythergraph(title="Monthly Temperature and Precipitation")
 plt.show()